@@ -50,5 +50,7 @@ setup(
     ],
     extras_require={
         "dev": ["pytest", "requests-mock", "flake8", "black"],
+        "speedups": ["orjson"],
+        "cache": ["requests-cache"],
     },
 )
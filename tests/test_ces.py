@@ -0,0 +1,95 @@
+import json
+from urllib.parse import parse_qs
+import pytest
+import requests_mock
+from wcesapi.ces import CES
+from wcesapi.requester import RequesterError
+
+
+def test_metadata_writer_batches_per_user():
+    ces = CES("https://school.evaluationkit.com", "test_token")
+    with requests_mock.Mocker() as m:
+        m.post(
+            "https://school.evaluationkit.com/api/users/metadata-batch",
+            json={"resultList": []},
+        )
+        with ces.metadata_writer(max_batch_size=2) as writer:
+            writer.save("jdoe", "a", "1")
+            writer.save("jdoe", "b", "2")
+            writer.save("jdoe", "a", "3")
+            writer.save("asmith", "c", "4")
+            writer.save("jdoe", "d", "5")
+            assert m.call_count == 0
+
+        batches = [
+            (r.qs["username"][0], json.loads(parse_qs(r.text)["metadata"][0]))
+            for r in m.request_history
+        ]
+        assert batches == [
+            ("jdoe", [{"name": "a", "value": "3"}, {"name": "b", "value": "2"}]),
+            ("jdoe", [{"name": "d", "value": "5"}]),
+            ("asmith", [{"name": "c", "value": "4"}]),
+        ]
+
+
+def test_metadata_writer_keeps_unsent_values_on_failure():
+    ces = CES("https://school.evaluationkit.com", "test_token")
+    writer = ces.metadata_writer(max_batch_size=1)
+    writer.save("jdoe", "a", "1")
+    writer.save("jdoe", "b", "2")
+    with requests_mock.Mocker() as m:
+        m.post(
+            "https://school.evaluationkit.com/api/users/metadata-batch",
+            [{"json": {"resultList": []}}, {"status_code": 500}],
+        )
+        with pytest.raises(RequesterError):
+            writer.flush()
+
+    with requests_mock.Mocker() as m:
+        m.post(
+            "https://school.evaluationkit.com/api/users/metadata-batch",
+            json={"resultList": []},
+        )
+        writer.flush()
+        assert [
+            json.loads(parse_qs(r.text)["metadata"][0]) for r in m.request_history
+        ] == [[{"name": "b", "value": "2"}]]
+
+
+@pytest.mark.parametrize("max_batch_size", [0, -1])
+def test_metadata_writer_rejects_invalid_batch_size(max_batch_size):
+    ces = CES("https://school.evaluationkit.com", "test_token")
+    with pytest.raises(ValueError, match="max_batch_size"):
+        ces.metadata_writer(max_batch_size=max_batch_size)
+
+
+def test_admin_user_payload_matches_for_create_and_update():
+    ces = CES("https://school.evaluationkit.com", "test_token")
+    url = "https://school.evaluationkit.com/api/users/administrator"
+    arguments = dict(
+        username="jdoe",
+        user_type=1,
+        user_types=[1, 2],
+        first_name="J",
+        last_name="Doe",
+        email="jdoe@example.com",
+        roles=[3],
+        node_path=["Root"],
+    )
+    with requests_mock.Mocker() as m:
+        m.post(url, json={"id": 1})
+        m.put(url, json={"id": 1})
+        ces.create_admin_user(**arguments)
+        ces.update_admin_user(**arguments, user_id=1)
+        created, updated = (parse_qs(r.text) for r in m.request_history)
+        assert created == {
+            "username": ["jdoe"],
+            "userType": ["1"],
+            "userTypes": ["[1,2]"],
+            "firstName": ["J"],
+            "lastName": ["Doe"],
+            "email": ["jdoe@example.com"],
+            "roles": ["[3]"],
+            "nodePath": ['["Root"]'],
+        }
+        assert updated == {"userId": ["1"], **created}
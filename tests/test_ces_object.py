@@ -0,0 +1,250 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+import requests_mock
+from wcesapi.requester import Requester
+from wcesapi.project import Project
+
+
+@pytest.fixture
+def requester():
+    return Requester(base_url="http://example.com", access_token="test_token")
+
+
+def test_single_item_response(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1, "title": "Spring"})
+        project = Project(requester, "GET", "projects/1")
+        assert project.id == 1
+        assert project.title == "Spring"
+        assert project.data == {"id": 1, "title": "Spring"}
+
+
+def test_instances_have_no_dict(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1})
+        project = Project(requester, "GET", "projects/1")
+        assert not hasattr(project, "__dict__")
+
+
+def test_get_is_deferred_until_access(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1})
+        project = Project(requester, "GET", "projects/1")
+        assert m.call_count == 0
+        assert project.id == 1
+        assert project.df.shape == (1, 1)
+        assert m.call_count == 1
+
+
+def test_post_is_sent_immediately(requester):
+    with requests_mock.Mocker() as m:
+        m.post("http://example.com/api/projects", json={"id": 1})
+        Project(requester, "POST", "projects", data={"title": "New"})
+        assert m.call_count == 1
+
+
+def test_first_only_stops_after_first_page(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            json={"resultList": [{"id": 1}], "page": 1, "pageSize": 1},
+        )
+        projects = Project(requester, "GET", "projects", first_only=True)
+        assert projects.id == 1
+        assert m.call_count == 1
+
+
+def test_date_columns_are_converted(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects/1",
+            json={"id": 1, "startDate": "2024-01-15T00:00:00", "endDate": "bad"},
+        )
+        project = Project(requester, "GET", "projects/1")
+        assert project.startDate == pd.Timestamp("2024-01-15")
+        assert pd.isna(project.endDate)
+
+
+def test_null_result_list_entries_are_skipped(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            json={"resultList": [{"id": 1}, None, {"id": 2}]},
+        )
+        projects = Project(requester, "GET", "projects")
+        assert projects.id.tolist() == [1, 2]
+
+
+def test_pagination_requests_next_page(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            [
+                {"json": {"resultList": [{"id": 1}], "page": 1, "pageSize": 1}},
+                {"json": {"resultList": [], "page": 2, "pageSize": 1}},
+            ],
+        )
+        projects = Project(requester, "GET", "projects")
+        assert projects.id == 1
+        assert m.call_count == 2
+        assert m.request_history[1].qs["page"] == ["2"]
+
+
+def test_to_categorical_converts_repeated_strings(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            json={
+                "resultList": [
+                    {"id": i, "status": "Ended", "title": f"P{i}", "tags": [i]}
+                    for i in range(4)
+                ]
+            },
+        )
+        projects = Project(requester, "GET", "projects")
+        assert projects.df["status"].dtype != "category"
+        compact = projects.to_categorical()
+        assert isinstance(compact, Project)
+        assert compact.df["status"].dtype == "category"
+        assert compact.df["title"].dtype != "category"
+        assert compact.df["tags"].dtype != "category"
+
+
+def test_pages_are_concatenated_in_order(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            [
+                {
+                    "json": {
+                        "resultList": [{"id": 1}, {"id": 2}],
+                        "page": 1,
+                        "pageSize": 2,
+                    }
+                },
+                {
+                    "json": {
+                        "resultList": [{"id": 3}, {"id": 4}],
+                        "page": 2,
+                        "pageSize": 2,
+                    }
+                },
+                {"json": {"resultList": [{"id": 5}], "page": 3, "pageSize": 2}},
+            ],
+        )
+        projects = Project(requester, "GET", "projects")
+        assert projects.id.tolist() == [1, 2, 3, 4, 5]
+        assert m.call_count == 3
+
+
+def test_dates_are_converted_across_pages(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            [
+                {
+                    "json": {
+                        "resultList": [{"id": 1, "endDate": "2024-05-01T00:00:00Z"}],
+                        "page": 1,
+                        "pageSize": 1,
+                    }
+                },
+                {
+                    "json": {
+                        "resultList": [{"id": 2, "endDate": None}],
+                        "page": 2,
+                        "pageSize": 1,
+                    }
+                },
+                {"json": {"resultList": [], "page": 3, "pageSize": 1}},
+            ],
+        )
+        projects = Project(requester, "GET", "projects")
+        assert isinstance(projects.endDate.dtype, pd.DatetimeTZDtype)
+        assert projects.endDate.dt.year.tolist()[0] == 2024
+        assert list(projects)[1].endDate is pd.NaT
+
+
+def test_missing_attribute_raises(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1})
+        project = Project(requester, "GET", "projects/1")
+        assert not hasattr(project, "__array__")
+        assert m.call_count == 0
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            project.missing
+
+
+def test_iteration_streams_pages(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            [
+                {"json": {"resultList": [{"id": 1}], "page": 1, "pageSize": 1}},
+                {"json": {"resultList": [], "page": 2, "pageSize": 1}},
+            ],
+        )
+        projects = Project(requester, "GET", "projects")
+        rows = iter(projects)
+        assert next(rows).id == 1
+        assert list(rows) == []
+        assert projects.id == 1
+        assert m.call_count == 2
+
+
+def test_project_fetch_all(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1})
+        m.get("http://example.com/api/projects/1/surveys", json={"id": 10})
+        m.get("http://example.com/api/projects/1/courses", json={"id": 20})
+        project = Project(requester, "GET", "projects/1")
+        related = project.fetch_all(include=("surveys", "courses"))
+        assert m.call_count == 3
+        assert related["surveys"].id == 10
+        assert related["courses"].id == 20
+        with pytest.raises(ValueError, match="bogus"):
+            project.fetch_all(include=("bogus",))
+
+
+def test_update_project_course_payload(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1})
+        m.put("http://example.com/api/projects/1/courses/5", json={"id": 5})
+        project = Project(requester, "GET", "projects/1")
+        project.update_project_course(
+            5,
+            node_id=2,
+            code="C1",
+            title="T",
+            unique_id="U",
+            start_date=datetime(2024, 1, 1),
+        )
+        assert m.last_request.text == (
+            "nodeId=2&code=C1&title=T&uniqueId=U&startDate=2024-01-01T00%3A00%3A00"
+        )
+
+
+def test_project_str_is_cached(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", json={"id": 1, "title": "Spring"})
+        project = Project(requester, "GET", "projects/1")
+        assert str(project) == "Spring (1)"
+        assert str(project) is str(project)
+        assert m.call_count == 1
+
+
+def test_iter_pages_does_not_store_data(requester):
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/projects",
+            [
+                {"json": {"resultList": [{"id": 1}], "page": 1, "pageSize": 1}},
+                {"json": {"resultList": [{"id": 2}], "page": 2, "pageSize": 2}},
+            ],
+        )
+        projects = Project(requester, "GET", "projects")
+        pages = list(projects.iter_pages())
+        assert [type(page) for page in pages] == [Project, Project]
+        assert [page.id for page in pages] == [1, 2]
+        assert not projects._fetched
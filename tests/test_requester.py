@@ -1,15 +1,18 @@
 import logging
+import pandas as pd
 import pytest
 import requests
 import requests_mock
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from wcesapi.requester import (
     Requester,
     UnauthorizedAccess,
     ResourceDoesNotExist,
     UnprocessableEntity,
     RequesterError,
+    CircuitOpen,
+    MAX_RETRY_AFTER,
 )
 
 
@@ -24,6 +27,62 @@ def test_requester_initialization(requester):
     assert requester.max_retries == 3
     assert requester.retry_backoff == 2
     assert requester.rate_limit_delay == 1
+    assert requester._session.headers["Accept"] == "application/json"
+
+
+def test_session_connection_pool(requester):
+    adapter = requester._session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 20
+
+
+def test_session_connection_pool_size():
+    requester = Requester("http://example.com", "test_token", pool_size=32)
+    adapter = requester._session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 32
+
+
+def test_cache_backend_requires_requests_cache(mocker):
+    mocker.patch("wcesapi.requester.requests_cache", None)
+    with pytest.raises(ImportError, match="requests-cache"):
+        Requester("http://example.com", "test_token", cache_backend="sqlite")
+
+
+def test_cache_backend_is_keyed_on_token(mocker):
+    mock_cache = mocker.patch("wcesapi.requester.requests_cache")
+    Requester(
+        "http://example.com",
+        "test_token",
+        cache_backend="sqlite",
+        cache_name="/tmp/wcesapi.sqlite",
+    )
+    args, kwargs = mock_cache.CachedSession.call_args
+    assert args == ("/tmp/wcesapi.sqlite",)
+    assert kwargs["match_headers"] == ["AuthToken"]
+    assert kwargs["use_cache_dir"] is False
+
+
+def test_clear_cache_clears_persistent_cache(mocker):
+    mock_cache = mocker.patch("wcesapi.requester.requests_cache")
+    requester = Requester("http://example.com", "test_token", cache_backend="sqlite")
+    requester.clear_cache()
+    mock_cache.CachedSession.return_value.cache.clear.assert_called_once_with()
+
+
+def test_context_manager_closes_session(mocker):
+    with Requester("http://example.com", "test_token") as requester:
+        mock_close = mocker.patch.object(requester._session, "close")
+    mock_close.assert_called_once_with()
+
+
+def test_eager_connect_warms_up_in_background(mocker):
+    mock_thread = mocker.patch("threading.Thread")
+    requester = Requester("http://example.com", "test_token", eager_connect=True)
+    mock_thread.assert_called_once_with(target=requester._warm_up, daemon=True)
+    mock_thread.return_value.start.assert_called_once_with()
+    with requests_mock.Mocker() as m:
+        m.head("http://example.com/api/", status_code=401)
+        requester._warm_up()
+        assert m.call_count == 1
 
 
 def test_set_retry_options(requester):
@@ -73,21 +132,59 @@ def test_retry_on_rate_limit(requester, mocker):
         assert mock_handle_rate_limit.call_count == 2
 
 
+def test_retry_on_service_unavailable(requester, mocker):
+    mock_handle_rate_limit = mocker.patch.object(requester, "_handle_rate_limit")
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/test",
+            [{"status_code": 503}, {"json": {"success": True}}],
+        )
+        assert requester.request("GET", "test") == {"success": True}
+        assert mock_handle_rate_limit.call_count == 1
+
+
+def test_no_wait_after_final_rate_limited_attempt(requester, mocker):
+    mock_handle_rate_limit = mocker.patch.object(requester, "_handle_rate_limit")
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", status_code=429)
+        with pytest.raises(RequesterError):
+            requester.request("GET", "test")
+        assert mock_handle_rate_limit.call_count == requester.max_retries - 1
+
+
 def test_prepare_request_kwargs(requester):
     kwargs = requester._prepare_request_kwargs(
         params={"key": "value"}, data={"data_key": "data_value"}
     )
     assert kwargs == {"params": {"key": "value"}, "data": {"data_key": "data_value"}}
-    assert (
-        requester._session.headers["Content-Type"]
-        == "application/x-www-form-urlencoded"
+    assert "Content-Type" not in requester._session.headers
+
+
+def test_form_content_type_is_per_request(requester):
+    with requests_mock.Mocker() as m:
+        m.post("http://example.com/api/test", json={"created": True})
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("POST", "test", data={"name": "value"})
+        assert (
+            m.last_request.headers["Content-Type"]
+            == "application/x-www-form-urlencoded"
+        )
+        requester.request("GET", "test")
+        assert "Content-Type" not in m.last_request.headers
+
+
+def test_prepare_request_kwargs_drops_none_params(requester):
+    kwargs = requester._prepare_request_kwargs(
+        params={"key": "value", "empty": None, "since": datetime(2024, 1, 1)},
+        data=None,
     )
+    assert kwargs == {"params": {"key": "value", "since": "2024-01-01T00:00:00"}}
 
 
-def test_filter_none_values():
+def test_format_values_drops_none():
     data = {"a": 1, "b": None, "c": "test"}
-    filtered = Requester._filter_none_values(data)
-    assert filtered == {"a": 1, "c": "test"}
+    formatted = Requester._format_values(data)
+    assert formatted == {"a": "1", "c": "test"}
 
 
 def test_format_value():
@@ -98,7 +195,26 @@ def test_format_value():
     assert Requester._format_value(123) == "123"
 
 
-def test_calculate_rate_limit_delay(requester):
+def test_format_value_serializes_nested_values_as_json():
+    assert Requester._format_value([1, 2]) == "[1,2]"
+    assert (
+        Requester._format_value([{"name": "a", "at": datetime(2023, 1, 1)}])
+        == '[{"name":"a","at":"2023-01-01T00:00:00"}]'
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_format_value_json_matches_with_and_without_orjson(use_orjson, mocker):
+    if not use_orjson:
+        mocker.patch("wcesapi.requester.orjson", None)
+    assert Requester._format_value([pd.Timestamp("2024-01-01")]) == (
+        '["2024-01-01T00:00:00"]'
+    )
+    assert Requester._format_value({1: "a"}) == '{"1":"a"}'
+
+
+def test_calculate_rate_limit_delay(requester, mocker):
+    mocker.patch("random.random", return_value=0.5)
     assert requester._calculate_rate_limit_delay(0) == 1
     assert requester._calculate_rate_limit_delay(1) == 2
     assert requester._calculate_rate_limit_delay(2) == 4
@@ -107,6 +223,14 @@ def test_calculate_rate_limit_delay(requester):
     requester.retry_backoff = 3
     assert requester._calculate_rate_limit_delay(0) == 2
     assert requester._calculate_rate_limit_delay(1) == 6
+    assert requester._calculate_rate_limit_delay(2) == 7.5
+
+
+def test_calculate_rate_limit_delay_is_jittered(requester, mocker):
+    mocker.patch("random.random", return_value=0.0)
+    assert requester._calculate_rate_limit_delay(1) == 0
+    mocker.patch("random.random", return_value=0.999)
+    assert requester._calculate_rate_limit_delay(1) < 4
 
 
 def test_handle_rate_limit(requester, mocker):
@@ -120,6 +244,56 @@ def test_handle_rate_limit(requester, mocker):
     mock_sleep.assert_called_once_with(5)
 
 
+def test_rate_limit_backoff_is_shared(requester, mocker):
+    mocker.patch("time.monotonic", return_value=100)
+    mock_sleep = mocker.patch("time.sleep")
+    mock_uniform = mocker.patch("random.uniform", return_value=0.25)
+    mocker.patch.object(requester, "_calculate_rate_limit_delay", return_value=5)
+
+    requester._handle_rate_limit(0)
+    mock_sleep.reset_mock()
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+    mock_uniform.assert_called_once_with(0, 0.5)
+    mock_sleep.assert_called_once_with(5.25)
+
+
+def test_handle_rate_limit_honors_retry_after(requester, mocker):
+    mock_sleep = mocker.patch("time.sleep")
+    mock_uniform = mocker.patch("random.uniform", return_value=0.25)
+    response = requests.Response()
+    response.headers["Retry-After"] = "7"
+
+    requester._handle_rate_limit(0, response)
+    mock_uniform.assert_called_once_with(0, 0.5)
+    mock_sleep.assert_called_once_with(7.25)
+
+
+def test_parse_retry_after_http_date(mocker):
+    response = requests.Response()
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:30 GMT"
+    mock_datetime = mocker.patch("wcesapi.requester.datetime", wraps=datetime)
+    mock_datetime.now.return_value = datetime(2015, 10, 21, 7, 28, tzinfo=timezone.utc)
+    assert Requester._parse_retry_after(response) == 30.0
+
+    response.headers["Retry-After"] = "soon"
+    assert Requester._parse_retry_after(response) is None
+
+
+@pytest.mark.parametrize("value", ["inf", "-inf", "nan"])
+def test_parse_retry_after_rejects_non_finite(value):
+    response = requests.Response()
+    response.headers["Retry-After"] = value
+    assert Requester._parse_retry_after(response) is None
+
+
+def test_parse_retry_after_is_capped():
+    response = requests.Response()
+    response.headers["Retry-After"] = "86400"
+    assert Requester._parse_retry_after(response) == MAX_RETRY_AFTER
+
+
 def test_log_response(requester, caplog):
     caplog.set_level(logging.INFO)
     with requests_mock.Mocker() as m:
@@ -140,6 +314,12 @@ def test_parse_response(requester):
     assert requester._parse_response(mock_response) == {"raw_text": "Not JSON"}
 
 
+def test_endpoint_is_relative_to_api_root(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/surveys/1", json={"id": 1})
+        assert requester.request("GET", "/surveys/1") == {"id": 1}
+
+
 def test_request_exception(requester):
     with requests_mock.Mocker() as m:
         m.get("http://example.com/api/test", exc=requests.RequestException)
@@ -153,3 +333,179 @@ def test_max_retries_exceeded(requester):
         with pytest.raises(RequesterError, match="Request failed after all retries"):
             requester.request("GET", "test")
 
+
+def test_cache_disabled_by_default(requester):
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+        requester.request("GET", "test")
+        assert m.call_count == 2
+
+
+def test_cached_get_skips_network():
+    requester = Requester("http://example.com", "test_token", cache_maxsize=2)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        assert requester.request("GET", "test", params={"a": 1}) == {"success": True}
+        assert requester.request("GET", "test", params={"a": 1}) == {"success": True}
+        assert m.call_count == 1
+        requester.request("GET", "test", params={"a": 2})
+        assert m.call_count == 2
+
+
+def test_cache_evicts_least_recently_used():
+    requester = Requester("http://example.com", "test_token", cache_maxsize=1)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/one", json={"one": True})
+        m.get("http://example.com/api/two", json={"two": True})
+        requester.request("GET", "one")
+        requester.request("GET", "two")
+        requester.request("GET", "one")
+        assert m.call_count == 3
+
+
+def test_cache_expires_after_ttl(mocker):
+    requester = Requester(
+        "http://example.com", "test_token", cache_maxsize=2, cache_ttl=10
+    )
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+        mock_monotonic.return_value = 111
+        requester.request("GET", "test")
+        assert m.call_count == 2
+
+
+def test_expired_cache_entry_is_revalidated_with_etag(mocker):
+    requester = Requester(
+        "http://example.com", "test_token", cache_maxsize=2, cache_ttl=10
+    )
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    with requests_mock.Mocker() as m:
+        m.get(
+            "http://example.com/api/test",
+            [
+                {"json": {"success": True}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        requester.request("GET", "test")
+        mock_monotonic.return_value = 111
+        assert requester.request("GET", "test") == {"success": True}
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+        mock_monotonic.return_value = 115
+        requester.request("GET", "test")
+        assert m.call_count == 2
+
+
+def test_not_found_is_cached_briefly(mocker):
+    requester = Requester(
+        "http://example.com", "test_token", cache_maxsize=2, negative_cache_ttl=5
+    )
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/projects/1", status_code=404)
+        for _ in range(2):
+            with pytest.raises(ResourceDoesNotExist):
+                requester.request("GET", "projects/1")
+        assert m.call_count == 1
+        mock_monotonic.return_value = 106
+        with pytest.raises(ResourceDoesNotExist):
+            requester.request("GET", "projects/1")
+        assert m.call_count == 2
+
+
+def test_circuit_breaker_fails_fast_after_threshold(mocker):
+    requester = Requester(
+        "http://example.com",
+        "test_token",
+        circuit_breaker_threshold=2,
+        circuit_breaker_cooldown=30,
+    )
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", status_code=500)
+        for _ in range(2):
+            with pytest.raises(RequesterError):
+                requester.request("GET", "test")
+        with pytest.raises(CircuitOpen):
+            requester.request("GET", "test")
+        assert m.call_count == 2
+
+        mock_monotonic.return_value = 131
+        m.get("http://example.com/api/test", json={"success": True})
+        assert requester.request("GET", "test") == {"success": True}
+        assert requester.request("GET", "test") == {"success": True}
+
+
+def test_circuit_breaker_lets_one_probe_through(mocker):
+    requester = Requester(
+        "http://example.com",
+        "test_token",
+        circuit_breaker_threshold=1,
+        circuit_breaker_cooldown=30,
+    )
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    requester._record_outcome(failed=True)
+    mock_monotonic.return_value = 131
+
+    # The first caller after the cooldown is the probe; others wait for it
+    requester._check_circuit()
+    with pytest.raises(CircuitOpen):
+        requester._check_circuit()
+
+    requester._record_outcome(failed=False)
+    requester._check_circuit()
+
+
+def test_requests_are_paced_after_burst(mocker):
+    mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+    mock_sleep = mocker.patch("time.sleep")
+    requester = Requester(
+        "http://example.com", "test_token", requests_per_second=2, burst=2
+    )
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+        requester.request("GET", "test")
+        mock_sleep.assert_not_called()
+        requester.request("GET", "test")
+        mock_sleep.assert_called_once_with(0.5)
+
+        mock_monotonic.return_value = 102
+        mock_sleep.reset_mock()
+        requester.request("GET", "test")
+        mock_sleep.assert_not_called()
+
+
+def test_write_clears_cache():
+    requester = Requester("http://example.com", "test_token", cache_maxsize=2)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        m.post("http://example.com/api/test", json={"created": True})
+        requester.request("GET", "test")
+        requester.request("POST", "test", data={"name": "value"})
+        requester.request("GET", "test")
+        assert m.call_count == 3
+
+
+def test_log_response_parses_body_once(requester, caplog, mocker):
+    caplog.set_level(logging.DEBUG)
+    json_spy = mocker.spy(requests.Response, "json")
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+    assert json_spy.call_count == 0
+    assert any(
+        record.message == "Response data: {'success': True}"
+        for record in caplog.records
+    )
+
+
+def test_log_response_skips_body_above_debug(requester, caplog):
+    caplog.set_level(logging.INFO)
+    with requests_mock.Mocker() as m:
+        m.get("http://example.com/api/test", json={"success": True})
+        requester.request("GET", "test")
+    assert not any("Response data" in record.message for record in caplog.records)
@@ -2,4 +2,4 @@ from wcesapi.ces_object import CESObject
 
 
 class Account(CESObject):
-    pass
+    __slots__ = ()
@@ -8,11 +8,11 @@ from wcesapi.course import Course
 from wcesapi.node import Node
 from wcesapi.node_mapper import NodeMapper
 from wcesapi.project import Project
-from wcesapi.requester import Requester
+from wcesapi.requester import HttpMethod, Requester
 from wcesapi.survey import Survey
 from wcesapi.term import Term
 from wcesapi.user import User
-from wcesapi.metadata import Metadata
+from wcesapi.metadata import Metadata, MetadataBatchWriter
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +30,18 @@ class CES:
         max_retries: Optional[int] = None,
         retry_backoff: Optional[int] = None,
         rate_limit_delay: Optional[int] = None,
+        cache_maxsize: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        cache_backend: Optional[str] = None,
+        cache_expire_after: Optional[float] = None,
+        cache_name: Optional[str] = None,
+        eager_connect: bool = False,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_cooldown: Optional[float] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
     ) -> None:
         """
         Initialize the CES instance.
@@ -40,6 +52,18 @@ class CES:
             max_retries (Optional[int], optional): Maximum number of retry attempts for failed requests. Defaults to None.
             retry_backoff (Optional[int], optional): Exponential backoff factor for retries (in seconds). Defaults to None.
             rate_limit_delay (Optional[int], optional): Initial delay for rate limiting (in seconds). Defaults to None.
+            cache_maxsize (Optional[int], optional): Maximum number of GET responses to cache. Defaults to None (disabled).
+            cache_ttl (Optional[float], optional): Number of seconds a cached GET response stays valid. Defaults to None (60 seconds).
+            negative_cache_ttl (Optional[float], optional): Number of seconds a 404 for a GET is cached while the cache is enabled. Defaults to None (5 seconds).
+            pool_size (Optional[int], optional): Maximum number of keep-alive connections to the CES host. Defaults to None (20).
+            cache_backend (Optional[str], optional): requests-cache backend, such as "sqlite", for persisting GET responses. Defaults to None (disabled).
+            cache_expire_after (Optional[float], optional): Number of seconds a persisted GET response stays valid. Defaults to None (3600 seconds).
+            cache_name (Optional[str], optional): Name or path of the persistent cache. Defaults to None ("wcesapi_cache" in the user cache directory).
+            eager_connect (bool, optional): Open a connection to the CES host in the background at construction. Defaults to False.
+            circuit_breaker_threshold (Optional[int], optional): Number of consecutive failed requests after which requests fail fast. Defaults to None (disabled).
+            circuit_breaker_cooldown (Optional[float], optional): Number of seconds requests fail fast once the threshold is reached. Defaults to None (30 seconds).
+            requests_per_second (Optional[float], optional): Pace outgoing requests to this rate to avoid being rate limited. Defaults to None (no pacing).
+            burst (Optional[int], optional): Number of requests that may be sent at once before pacing applies. Defaults to None (requests_per_second).
         """
         self._validate_base_url(base_url)
         clean_base_url = self._clean_url(base_url)
@@ -51,6 +75,18 @@ class CES:
             max_retries=max_retries,
             retry_backoff=retry_backoff,
             rate_limit_delay=rate_limit_delay,
+            cache_maxsize=cache_maxsize,
+            cache_ttl=cache_ttl,
+            negative_cache_ttl=negative_cache_ttl,
+            pool_size=pool_size,
+            cache_backend=cache_backend,
+            cache_expire_after=cache_expire_after,
+            cache_name=cache_name,
+            eager_connect=eager_connect,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_cooldown=circuit_breaker_cooldown,
+            requests_per_second=requests_per_second,
+            burst=burst,
         )
         logger.info(f"CES instance initialized with base URL: {clean_base_url}")
 
@@ -67,6 +103,7 @@ class CES:
             f"max_retries={self._requester.max_retries}",
             f"retry_backoff={self._requester.retry_backoff}",
             f"rate_limit_delay={self._requester.rate_limit_delay}",
+            f"pool_size={self._requester.pool_size}",
         ]
         attr_str = ",\n    ".join(attributes)
         return f"{classname}(\n    {attr_str}\n)"
@@ -155,6 +192,32 @@ class CES:
         """
         self._requester.set_rate_limit_delay(rate_limit_delay)
 
+    def set_cache_options(
+        self, cache_maxsize: Optional[int], cache_ttl: Optional[float]
+    ) -> None:
+        """
+        Set response cache options for the requester.
+
+        Args:
+            cache_maxsize (Optional[int]): Maximum number of GET responses to cache. None or 0 disables the cache.
+            cache_ttl (Optional[float]): Number of seconds a cached GET response stays valid.
+        """
+        self._requester.set_cache_options(cache_maxsize, cache_ttl)
+
+    def clear_cache(self) -> None:
+        """Clear all cached GET responses."""
+        self._requester.clear_cache()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._requester.close()
+
+    def __enter__(self) -> "CES":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def get_account(self) -> Account:
         """Gets the account for your token."""
         api_endpoint = "account"
@@ -228,7 +291,7 @@ class CES:
         params = {
             "projectType": project_type,
             "projectStatus": project_status,
-            "endedSince": ended_since.isoformat() if ended_since else None,
+            "endedSince": ended_since,
             "includeSubaccounts": include_subaccounts,
         }
         return Project(self._requester, "GET", api_endpoint, params=params)
@@ -287,8 +350,8 @@ class CES:
         data = {
             "projectType": project_type,
             "projectStatus": project_status,
-            "startDate": start_date.isoformat(),
-            "endDate": end_date.isoformat(),
+            "startDate": start_date,
+            "endDate": end_date,
             "accountId": account_id,
             "title": title,
             "mainSurveyId": main_survey_id,
@@ -370,6 +433,13 @@ class CES:
         """
         Create or update user metadata.
 
+        Each call sends one request. To save many values, queue them on a
+        metadata_writer() instead so they are sent through the batch endpoint:
+
+            with ces.metadata_writer() as writer:
+                writer.save("jdoe", "department", "History")
+                writer.save("jdoe", "year", "2024")
+
         Args:
             username (str): The username to update.
             name (str): The name of the metadata.
@@ -407,6 +477,22 @@ class CES:
             data=data,
         )
 
+    def metadata_writer(self, max_batch_size: int = 100) -> MetadataBatchWriter:
+        """
+        Creates a writer that batches user metadata saves per user.
+
+        Args:
+            max_batch_size (int, optional): Maximum number of values sent in one
+                batch request. Defaults to 100.
+
+        Returns:
+            MetadataBatchWriter: A writer whose queued values are saved on flush().
+
+        Raises:
+            ValueError: If max_batch_size is less than 1.
+        """
+        return MetadataBatchWriter(self, max_batch_size)
+
     def remove_user_metadata(self, username: str, name: str) -> None:
         """
         Removes a user metadata by name in the account.
@@ -452,21 +538,20 @@ class CES:
         Returns:
             User: A User object representing the created user.
         """
-        api_endpoint = "users/administrator"
-        data = {
-            "userId": user_id,
-            "accountId": account_id,
-            "username": username,
-            "userType": user_type,
-            "userTypes": user_types,
-            "firstName": first_name,
-            "lastName": last_name,
-            "email": email,
-            "password": password,
-            "roles": roles,
-            "nodePath": node_path,
-        }
-        return User(self._requester, "POST", api_endpoint, data=data)
+        return self._save_admin_user(
+            "POST",
+            username=username,
+            user_type=user_type,
+            user_types=user_types,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            roles=roles,
+            node_path=node_path,
+            user_id=user_id,
+            account_id=account_id,
+            password=password,
+        )
 
     def update_admin_user(
         self,
@@ -501,7 +586,47 @@ class CES:
         Returns:
             User: A User object representing the updated user.
         """
-        api_endpoint = "users/administrator"
+        return self._save_admin_user(
+            "PUT",
+            username=username,
+            user_type=user_type,
+            user_types=user_types,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            roles=roles,
+            node_path=node_path,
+            user_id=user_id,
+            account_id=account_id,
+            password=password,
+        )
+
+    def _save_admin_user(
+        self,
+        method: HttpMethod,
+        *,
+        username: str,
+        user_type: int,
+        user_types: list[int],
+        first_name: str,
+        last_name: str,
+        email: str,
+        roles: list[int],
+        node_path: list[str],
+        user_id: Optional[int],
+        account_id: Optional[int],
+        password: Optional[str],
+    ) -> User:
+        """
+        Sends an administrator user to the API.
+
+        Args:
+            method (HttpMethod): "POST" to create the user, "PUT" to update it.
+            The remaining arguments are those of create_admin_user.
+
+        Returns:
+            User: The created or updated user.
+        """
         data = {
             "userId": user_id,
             "accountId": account_id,
@@ -515,7 +640,7 @@ class CES:
             "roles": roles,
             "nodePath": node_path,
         }
-        return User(self._requester, "PUT", api_endpoint, data=data)
+        return User(self._requester, method, "users/administrator", data=data)
 
     def list_nodes(self) -> Node:
         """Gets list of nodes."""
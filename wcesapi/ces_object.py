@@ -1,4 +1,5 @@
-from typing import Any, Dict, Hashable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterator, List, Optional
 
 import pandas as pd
 import logging
@@ -7,6 +8,11 @@ from wcesapi.requester import Requester, HttpMethod
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of objects fetched in parallel by
+# Project.fetch_all. Each object may also prefetch one page in the
+# background, so this stays within the default connection pool size.
+MAX_CONCURRENT_FETCHES = 4
+
 
 class CESObject:
     """
@@ -15,6 +21,17 @@ class CESObject:
     values as a single row.
     """
 
+    __slots__ = (
+        "_df",
+        "_requester",
+        "_request_method",
+        "_api_endpoint",
+        "_params",
+        "_data",
+        "_fetched",
+        "_first_only",
+    )
+
     def __init__(
         self,
         requester: Requester,
@@ -22,6 +39,7 @@ class CESObject:
         api_endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        first_only: bool = False,
     ) -> None:
         """
         Initializes the CESObject with the given parameters.
@@ -32,154 +50,271 @@ class CESObject:
             api_endpoint (str): The API endpoint to call.
             params (Optional[Dict[str, Any]]): Optional query parameters for GET requests.
             data (Optional[Dict[str, Any]]): Optional data for POST, PUT requests.
+            first_only (bool): Whether to stop after the first page of a paginated response.
+
+        GET requests are deferred until the data is first accessed. Other methods
+        have side effects on the API and are sent immediately.
         """
+        self._fetched = False
         self._df: pd.DataFrame = pd.DataFrame()
         self._requester = requester
         self._request_method: HttpMethod = request_method
         self._api_endpoint = api_endpoint
         self._params = params or {}
         self._data = data
+        self._first_only = first_only
         self._params["per_page"] = 100
 
-        self._fetch_all_data()
+        if request_method != "GET":
+            self._ensure_fetched()
 
     @property
     def df(self) -> pd.DataFrame:
         """Returns the underlying DataFrame."""
+        self._ensure_fetched()
         return self._df
 
+    def _ensure_fetched(self) -> None:
+        """Fetches the data from the API if it has not been fetched yet."""
+        if not self._fetched:
+            self._fetch_all_data()
+            self._fetched = True
+
     def __getattr__(self, name: str) -> Any:
         """
         Custom attribute access method.
 
-        If the attribute is a DataFrame column, returns the column data.
-        If it's a method, returns a lambda function that applies the method to all rows.
-        Otherwise, returns the attribute as is.
+        Only called once normal attribute lookup has failed. If the attribute is
+        a DataFrame column, returns the column data; otherwise raises
+        AttributeError without repeating the lookup. Dunder names are never
+        treated as columns, so protocol probes such as copy or pickle do not
+        trigger a fetch.
 
         Args:
             name (str): The name of the attribute being accessed.
 
         Returns:
-            Any: The attribute value, column data, or a lambda function for method application.
-        """
-        if name in self._df.columns:
-            return self._df[name].iloc[0] if len(self._df) == 1 else self._df[name]
-
-        attr = super().__getattribute__(name)
-        if callable(attr):
-            return lambda *args, **kwargs: self._apply_method(name, *args, **kwargs)
-        return attr
+            Any: The column data.
 
-    def _apply_method(self, name: str, *args, **kwargs):
+        Raises:
+            AttributeError: If the attribute is not a DataFrame column.
         """
-        Applies a method to all rows in the DataFrame.
+        if not (name.startswith("__") and name.endswith("__")):
+            self._ensure_fetched()
+            if name in self._df.columns:
+                return self._df[name].iloc[0] if len(self._df) == 1 else self._df[name]
 
-        Args:
-            name (str): The name of the method to apply.
-            *args: Variable length argument list for the method.
-            **kwargs: Arbitrary keyword arguments for the method.
-
-        Returns:
-            Union[CESObject, List[Any]]: A new CESObject if all results are CESObjects,
-            otherwise a list of results or a single result if there's only one.
-        """
-        results = [
-            getattr(self._row_to_obj(row), name)(*args, **kwargs)
-            for _, row in self._df.iterrows()
-        ]
-        if results and all(isinstance(result, CESObject) for result in results):
-            return self._combine_results(pd.concat([r.df for r in results]))
-        return results[0] if len(results) == 1 else results
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
-    def _row_to_obj(self, row: pd.Series) -> "CESObject":
+    @staticmethod
+    def _fetch_concurrently(objects: List["CESObject"]) -> None:
         """
-        Converts a single DataFrame row to a new CESObject.
+        Fetches the data of several objects in parallel threads.
 
         Args:
-            row (pd.Series): A single row from the DataFrame.
-
-        Returns:
-            CESObject: A new CESObject instance containing only the data from the given row.
+            objects (List[CESObject]): The objects to fetch. Objects that have
+                already been fetched are skipped.
         """
-        obj = type(self)(
-            self._requester,
-            self._request_method,
-            self._api_endpoint,
-            self._params,
-            self._data,
-        )
-        obj._df = pd.DataFrame([row])
-        return obj
-
-    def _combine_results(self, combined_df: pd.DataFrame) -> "CESObject":
+        pending = [obj for obj in objects if not obj._fetched]
+        if len(pending) < 2:
+            return
+        max_workers = min(MAX_CONCURRENT_FETCHES, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(CESObject._ensure_fetched, pending))
+
+    def _from_df(self, df: pd.DataFrame) -> "CESObject":
         """
-        Combines multiple DataFrame results into a single CESObject.
+        Creates a new object of the same type backed by the given DataFrame.
+
+        The new object shares this object's request configuration but is marked
+        as already fetched, so it never repeats the original request.
 
         Args:
-            combined_df (pd.DataFrame): A DataFrame containing combined results.
+            df (pd.DataFrame): The DataFrame to back the new object.
 
         Returns:
-            CESObject: A new CESObject instance containing the combined DataFrame.
+            CESObject: A new CESObject instance containing the given DataFrame.
         """
-        obj = type(self)(
-            self._requester,
-            self._request_method,
-            self._api_endpoint,
-            self._params,
-            self._data,
-        )
-        obj._df = combined_df
+        obj = type(self).__new__(type(self))
+        obj._fetched = True
+        obj._df = df
+        obj._requester = self._requester
+        obj._request_method = self._request_method
+        obj._api_endpoint = self._api_endpoint
+        obj._params = self._params
+        obj._data = self._data
+        obj._first_only = self._first_only
         return obj
 
     def __repr__(self) -> str:
         """Provides a detailed string representation of the object."""
+        self._ensure_fetched()
         classname = self.__class__.__name__
         data_str = self._df.__repr__()
         return f"{classname}:\n{data_str}"
 
     def __str__(self) -> str:
         """Provides a string representation of the DataFrame."""
+        self._ensure_fetched()
         return self._df.__str__()
 
     def __iter__(self):
-        """Allows iteration over the object's data."""
-        yield from self._df.itertuples(index=False)
+        """
+        Allows iteration over the object's data.
+
+        If the data has not been fetched yet, rows are yielded page by page as
+        each page arrives, and the DataFrame is assembled once iteration completes.
+        """
+        if self._fetched:
+            yield from self._df.itertuples(index=False)
+            return
+
+        frames = []
+        for frame in self._iter_pages():
+            frames.append(frame)
+            yield from frame.itertuples(index=False)
+        self._store_frames(frames)
+        self._fetched = True
+
+    def iter_pages(self) -> Iterator["CESObject"]:
+        """
+        Yields the data one page at a time without keeping earlier pages.
+
+        Unlike iterating over the object, the pages are not assembled into this
+        object's DataFrame, so memory use stays bounded by the page size.
+
+        Yields:
+            CESObject: An object of the same type backed by a single page.
+        """
+        if self._fetched:
+            yield self
+            return
+
+        for frame in self._iter_pages():
+            yield self._from_df(frame)
 
     def _fetch_all_data(self) -> None:
         """Fetches all available data, handling pagination and converting date columns."""
-        next_url = self._api_endpoint
-        while next_url:
-            response = self._requester.request(
-                self._request_method, next_url, params=self._params, data=self._data
-            )
-            data = response
-
-            if isinstance(data, dict) and "resultList" in data:
-                # Handle paginated response
-                result_list = data.get("resultList", [])
-                new_df = pd.DataFrame(result_list)
-                self._df = pd.concat([self._df, new_df], ignore_index=True)
-
-                page = data.get("page")
-                page_size = data.get("pageSize")
-                if page_size == len(result_list) and page is not None:
-                    next_url = next_url.replace(f"page={page}", f"page={page + 1}")
-                else:
-                    next_url = None
-            elif isinstance(data, dict):
-                # Handle single-item response
-                new_df = pd.DataFrame([data])
-                self._df = pd.concat([self._df, new_df], ignore_index=True)
-                next_url = None  # No pagination for single-item responses
-            else:
-                # Handle unexpected response type
-                logger.warning(f"Unexpected response type: {type(data)}")
-                next_url = None
-
-        self._convert_date_columns()
-
-    def _convert_date_columns(self) -> None:
-        """Converts date columns to datetime objects."""
+        self._store_frames(list(self._iter_pages(convert_dates=False)))
+
+    def _store_frames(self, frames: List[pd.DataFrame]) -> None:
+        """
+        Combines fetched page frames into the underlying DataFrame.
+
+        Date columns are converted after the pages are combined, so a column
+        that is empty on some pages still ends up with a single datetime dtype.
+
+        Args:
+            frames (List[pd.DataFrame]): The page frames, in page order.
+        """
+        if frames:
+            self._df = self._convert_date_columns(pd.concat(frames, ignore_index=True))
+
+    def _iter_pages(self, convert_dates: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Yields each page of data as a DataFrame.
+
+        While one page is converted to a DataFrame, the request for the next page
+        is already in flight on a background thread.
+
+        Args:
+            convert_dates (bool): Whether to convert each page's date columns.
+
+        Yields:
+            pd.DataFrame: The next page of data.
+        """
+        executor: Optional[ThreadPoolExecutor] = None
+        # A single params dict is reused for every page. It is only updated
+        # after the previous page's request has completed.
+        params = dict(self._params)
+        page = params.get("page", 1)
+        try:
+            data = self._request_page(params)
+            while data is not None:
+                next_page: Optional[Future] = None
+                if self._has_next_page(data):
+                    page += 1
+                    params["page"] = page
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1)
+                    next_page = executor.submit(self._request_page, params)
+
+                frame = self._page_to_frame(data)
+                if frame is not None:
+                    yield self._convert_date_columns(frame) if convert_dates else frame
+                data = next_page.result() if next_page is not None else None
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _request_page(self, params: Dict[str, Any]) -> Any:
+        """
+        Requests a single page of data from the API.
+
+        Args:
+            params (Dict[str, Any]): The query parameters for this page.
+
+        Returns:
+            Any: The JSON-decoded response data.
+        """
+        return self._requester.request(
+            self._request_method, self._api_endpoint, params=params, data=self._data
+        )
+
+    def _has_next_page(self, data: Any) -> bool:
+        """
+        Determines whether another page follows the given response.
+
+        A paginated response is the last page once it is empty or holds fewer
+        results than its page size.
+
+        Args:
+            data (Any): The JSON-decoded response data of the current page.
+
+        Returns:
+            bool: True if the next page should be requested.
+        """
+        if self._first_only or not isinstance(data, dict) or "resultList" not in data:
+            return False
+        result_list = data.get("resultList") or []
+        return bool(result_list) and data.get("pageSize") == len(result_list)
+
+    @staticmethod
+    def _page_to_frame(data: Any) -> Optional[pd.DataFrame]:
+        """
+        Converts a single page of response data to a DataFrame.
+
+        Args:
+            data (Any): The JSON-decoded response data.
+
+        Returns:
+            Optional[pd.DataFrame]: The page as a DataFrame, or None if the response
+            type is unexpected.
+        """
+        if isinstance(data, dict) and "resultList" in data:
+            # Handle paginated response
+            result_list = data.get("resultList") or []
+            return pd.DataFrame([r for r in result_list if r is not None])
+        elif isinstance(data, dict):
+            # Handle single-item response
+            return pd.DataFrame([data])
+        # Handle unexpected response type
+        logger.warning(f"Unexpected response type: {type(data)}")
+        return None
+
+    @staticmethod
+    def _convert_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts date columns to datetime objects.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to convert.
+
+        Returns:
+            pd.DataFrame: The DataFrame with its date columns converted.
+        """
         date_columns = [
             "created",
             "updated",
@@ -198,14 +333,69 @@ class CESObject:
             "courseSurveyEnd",
             "submitDate",
         ]
-        for col in date_columns:
-            if col in self._df.columns:
-                self._df[col] = pd.to_datetime(self._df[col], errors="coerce")
+        converted = {
+            col: pd.to_datetime(df[col], errors="coerce")
+            for col in date_columns
+            if col in df.columns
+        }
+        return df.assign(**converted) if converted else df
+
+    def to_categorical(self, max_unique_ratio: float = 0.5) -> "CESObject":
+        """
+        Returns a copy with low-cardinality string columns stored as categories.
+
+        Columns such as statuses repeat a few values across many rows, so the
+        category dtype stores them more compactly. The conversion is opt-in
+        because categorical columns behave differently from plain strings.
+
+        Args:
+            max_unique_ratio (float): Largest ratio of unique values to rows for
+                a column to be converted.
+
+        Returns:
+            CESObject: An object of the same type backed by the converted DataFrame.
+        """
+        self._ensure_fetched()
+        return self._from_df(
+            self._convert_categorical_columns(self._df, max_unique_ratio)
+        )
+
+    @staticmethod
+    def _convert_categorical_columns(
+        df: pd.DataFrame, max_unique_ratio: float
+    ) -> pd.DataFrame:
+        """
+        Converts low-cardinality string columns to the pandas category dtype.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to convert.
+            max_unique_ratio (float): Largest ratio of unique values to rows for
+                a column to be converted.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the selected columns converted.
+        """
+        if len(df) < 2:
+            return df
+        converted = {}
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            try:
+                unique_count = df[col].nunique(dropna=False)
+            except TypeError:
+                # Columns holding lists or dicts are unhashable
+                continue
+            if unique_count / len(df) < max_unique_ratio:
+                converted[col] = df[col].astype("category")
+        return df.assign(**converted) if converted else df
 
     @property
     def data(self) -> Dict[Hashable, Any]:
         """Returns a dictionary representation of the object's data."""
-        return self._df.to_dict(orient="records")[0] if not self._df.empty else {}
+        self._ensure_fetched()
+        if self._df.empty:
+            return {}
+        first_row = next(self._df.itertuples(index=False, name=None))
+        return dict(zip(self._df.columns, first_row))
 
     # def get_context(self, return_type: str) -> "CESObject":
     #     """
@@ -8,18 +8,23 @@ class Course(CESObject):
     Represents a Course in the CES system.
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return "{} ({})".format(self.title, self.id)
 
-    def list_projects(self):
+    def list_projects(self, first_only: bool = False):
         """
         Gets a list of projects for the course.
 
+        Args:
+            first_only (bool, optional): Only fetch the first page of projects. Defaults to False.
+
         Returns:
             Project: A Project object representing the retrieved projects.
         """
         api_endpoint = f"courses/{self.id}/projects"
-        return Project(self._requester, "GET", api_endpoint)
+        return Project(self._requester, "GET", api_endpoint, first_only=first_only)
 
     def list_metadata(self):
         """
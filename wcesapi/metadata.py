@@ -1,5 +1,80 @@
+from collections import defaultdict
+from itertools import islice
+from typing import TYPE_CHECKING, DefaultDict, Dict, List
+
 from wcesapi.ces_object import CESObject
 
+if TYPE_CHECKING:
+    from wcesapi.ces import CES
+
 
 class Metadata(CESObject):
-    pass
+    __slots__ = ()
+
+
+class MetadataBatchWriter:
+    """
+    Buffers user metadata writes and saves them through the batch endpoint.
+
+    Writes are grouped by username, so saving many values for one user costs a
+    single request per max_batch_size values instead of one request per value.
+    Saving the same name twice for a user keeps only the last value. Pending
+    writes are sent by flush(), or when a ``with`` block exits without an error.
+    """
+
+    def __init__(self, ces: "CES", max_batch_size: int = 100):
+        """
+        Initializes the writer.
+
+        Args:
+            ces (CES): The client used to send the batches.
+            max_batch_size (int): Maximum number of values sent in one request.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self._ces = ces
+        self.max_batch_size = max_batch_size
+        self._pending: DefaultDict[str, Dict[str, str]] = defaultdict(dict)
+
+    def __enter__(self) -> "MetadataBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def save(self, username: str, name: str, value: str) -> None:
+        """
+        Queues a metadata value to be saved for a user.
+
+        Args:
+            username (str): The username to update.
+            name (str): The name of the metadata.
+            value (str): The value of the metadata.
+        """
+        self._pending[username][name] = value
+
+    def flush(self) -> List[Metadata]:
+        """
+        Sends all queued metadata, one batch request per user and chunk.
+
+        Values are dropped from the queue only once their batch has been sent,
+        so if a request fails the unsent values stay queued for the next flush.
+
+        Returns:
+            List[Metadata]: The saved metadata returned by each batch request.
+        """
+        results = []
+        for username in list(self._pending):
+            values = self._pending[username]
+            while values:
+                batch = list(islice(values.items(), self.max_batch_size))
+                metadata = [{"name": name, "value": value} for name, value in batch]
+                results.append(self._ces.save_user_metadata_batch(username, metadata))
+                for name, _ in batch:
+                    del values[name]
+            del self._pending[username]
+        return results
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from wcesapi.ces_object import CESObject
 from wcesapi.nonrespondent import NonRespondent
 from wcesapi.project_survey import ProjectSurvey
@@ -7,6 +7,7 @@ from wcesapi.project_course import ProjectCourse
 from wcesapi.respondent import Respondent
 from wcesapi.response_rate import NodeResponseRate, ResponseRate, OverallResponseRate
 from wcesapi.raw_data import RawDataGeneral
+from wcesapi.requester import HttpMethod
 
 
 class Project(CESObject):
@@ -14,8 +15,32 @@ class Project(CESObject):
     Represents a Project in the CES system.
     """
 
+    # _display caches __str__; a project's data does not change once fetched
+    __slots__ = ("_display",)
+
+    # Names accepted by fetch_all, mapped to the method that builds each object
+    _RELATED_METHODS = {
+        "surveys": "list_project_surveys",
+        "courses": "list_project_courses",
+        "respondents": "list_respondents",
+        "non_respondents": "list_non_respondents",
+        "response_rate": "get_response_rate",
+        "overall_response_rate": "get_overall_response_rate",
+        "node_response_rate": "get_node_response",
+        "raw_data": "get_raw_data",
+    }
+
     def __str__(self):
-        return f"{self.title} ({self.id})"
+        try:
+            return self._display
+        except AttributeError:
+            self._display = f"{self.title} ({self.id})"
+            return self._display
+
+    @property
+    def _endpoint(self) -> str:
+        """The API endpoint of this project, which prefixes all of its sub-resources."""
+        return f"projects/{self.id}"
 
     def list_project_surveys(self):
         """
@@ -24,7 +49,7 @@ class Project(CESObject):
         Returns:
             ProjectSurvey: A ProjectSurvey object representing the retrieved surveys.
         """
-        api_endpoint = f"projects/{self.id}/surveys"
+        api_endpoint = f"{self._endpoint}/surveys"
         return ProjectSurvey(self._requester, "GET", api_endpoint)
 
     def list_project_courses(self):
@@ -34,7 +59,7 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the retrieved project courses.
         """
-        api_endpoint = f"projects/{self.id}/courses"
+        api_endpoint = f"{self._endpoint}/courses"
         return ProjectCourse(self._requester, "GET", api_endpoint)
 
     def get_project_course(self, course_id: int):
@@ -47,7 +72,7 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the retrieved project course.
         """
-        api_endpoint = f"projects/{self.id}/courses/{course_id}"
+        api_endpoint = f"{self._endpoint}/courses/{course_id}"
         return ProjectCourse(self._requester, "GET", api_endpoint)
 
     def list_project_courses_by_canvas_course_sis_id(self, canvas_course_sis_id: str):
@@ -60,7 +85,7 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the retrieved project courses.
         """
-        api_endpoint = f"projects/{self.id}/courses/canvascourse/{canvas_course_sis_id}"
+        api_endpoint = f"{self._endpoint}/courses/canvascourse/{canvas_course_sis_id}"
         return ProjectCourse(self._requester, "GET", api_endpoint)
 
     def list_project_courses_by_canvas_section_sis_id(self, canvas_section_sis_id: str):
@@ -73,9 +98,7 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the retrieved project courses.
         """
-        api_endpoint = (
-            f"projects/{self.id}/courses/canvassection/{canvas_section_sis_id}"
-        )
+        api_endpoint = f"{self._endpoint}/courses/canvassection/{canvas_section_sis_id}"
         return ProjectCourse(self._requester, "GET", api_endpoint)
 
     def create_project_course(
@@ -121,26 +144,26 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the newly created project course.
         """
-        api_endpoint = f"projects/{self.id}/courses"
-        data = {
-            "nodeId": node_id,
-            "code": code,
-            "title": title,
-            "uniqueId": unique_id,
-            "nodePath": node_path,
-            "crosslistUniqueId": crosslist_unique_id,
-            "startDate": start_date,
-            "endDate": end_date,
-            "adminReportAccessStartDate": admin_report_access_start_date,
-            "adminReportAccessEndDate": admin_report_access_end_date,
-            "instructorReportAccessStartDate": instructor_report_access_start_date,
-            "instructorReportAccessEndDate": instructor_report_access_end_date,
-            "taReportAccessStartDate": ta_report_access_start_date,
-            "taReportAccessEndDate": ta_report_access_end_date,
-            "customQuestionStartDate": custom_question_start_date,
-            "customQuestionEndDate": custom_question_end_date,
-        }
-        return ProjectCourse(self._requester, "POST", api_endpoint, data=data)
+        return self._save_project_course(
+            "POST",
+            f"{self._endpoint}/courses",
+            node_id=node_id,
+            code=code,
+            title=title,
+            unique_id=unique_id,
+            node_path=node_path,
+            crosslist_unique_id=crosslist_unique_id,
+            start_date=start_date,
+            end_date=end_date,
+            admin_report_access_start_date=admin_report_access_start_date,
+            admin_report_access_end_date=admin_report_access_end_date,
+            instructor_report_access_start_date=instructor_report_access_start_date,
+            instructor_report_access_end_date=instructor_report_access_end_date,
+            ta_report_access_start_date=ta_report_access_start_date,
+            ta_report_access_end_date=ta_report_access_end_date,
+            custom_question_start_date=custom_question_start_date,
+            custom_question_end_date=custom_question_end_date,
+        )
 
     def update_project_course(
         self,
@@ -187,7 +210,61 @@ class Project(CESObject):
         Returns:
             ProjectCourse: A ProjectCourse object representing the updated project course.
         """
-        api_endpoint = f"projects/{self.id}/courses/{course_id}"
+        return self._save_project_course(
+            "PUT",
+            f"{self._endpoint}/courses/{course_id}",
+            node_id=node_id,
+            code=code,
+            title=title,
+            unique_id=unique_id,
+            node_path=node_path,
+            crosslist_unique_id=crosslist_unique_id,
+            start_date=start_date,
+            end_date=end_date,
+            admin_report_access_start_date=admin_report_access_start_date,
+            admin_report_access_end_date=admin_report_access_end_date,
+            instructor_report_access_start_date=instructor_report_access_start_date,
+            instructor_report_access_end_date=instructor_report_access_end_date,
+            ta_report_access_start_date=ta_report_access_start_date,
+            ta_report_access_end_date=ta_report_access_end_date,
+            custom_question_start_date=custom_question_start_date,
+            custom_question_end_date=custom_question_end_date,
+        )
+
+    def _save_project_course(
+        self,
+        method: HttpMethod,
+        api_endpoint: str,
+        *,
+        node_id: int,
+        code: str,
+        title: str,
+        unique_id: str,
+        node_path: Optional[str],
+        crosslist_unique_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        admin_report_access_start_date: Optional[datetime],
+        admin_report_access_end_date: Optional[datetime],
+        instructor_report_access_start_date: Optional[datetime],
+        instructor_report_access_end_date: Optional[datetime],
+        ta_report_access_start_date: Optional[datetime],
+        ta_report_access_end_date: Optional[datetime],
+        custom_question_start_date: Optional[datetime],
+        custom_question_end_date: Optional[datetime],
+    ) -> ProjectCourse:
+        """
+        Sends a project course to the API.
+
+        Args:
+            method (HttpMethod): "POST" to create a project course, "PUT" to update it.
+            api_endpoint (str): The endpoint of the project course, or of the
+                project's courses when creating one.
+            The remaining arguments are those of create_project_course.
+
+        Returns:
+            ProjectCourse: The created or updated project course.
+        """
         data = {
             "nodeId": node_id,
             "code": code,
@@ -195,50 +272,18 @@ class Project(CESObject):
             "uniqueId": unique_id,
             "nodePath": node_path,
             "crosslistUniqueId": crosslist_unique_id,
-            "startDate": start_date.isoformat() if start_date else None,
-            "endDate": end_date.isoformat() if end_date else None,
-            "adminReportAccessStartDate": (
-                admin_report_access_start_date.isoformat()
-                if admin_report_access_start_date
-                else None
-            ),
-            "adminReportAccessEndDate": (
-                admin_report_access_end_date.isoformat()
-                if admin_report_access_end_date
-                else None
-            ),
-            "instructorReportAccessStartDate": (
-                instructor_report_access_start_date.isoformat()
-                if instructor_report_access_start_date
-                else None
-            ),
-            "instructorReportAccessEndDate": (
-                instructor_report_access_end_date.isoformat()
-                if instructor_report_access_end_date
-                else None
-            ),
-            "taReportAccessStartDate": (
-                ta_report_access_start_date.isoformat()
-                if ta_report_access_start_date
-                else None
-            ),
-            "taReportAccessEndDate": (
-                ta_report_access_end_date.isoformat()
-                if ta_report_access_end_date
-                else None
-            ),
-            "customQuestionStartDate": (
-                custom_question_start_date.isoformat()
-                if custom_question_start_date
-                else None
-            ),
-            "customQuestionEndDate": (
-                custom_question_end_date.isoformat()
-                if custom_question_end_date
-                else None
-            ),
+            "startDate": start_date,
+            "endDate": end_date,
+            "adminReportAccessStartDate": admin_report_access_start_date,
+            "adminReportAccessEndDate": admin_report_access_end_date,
+            "instructorReportAccessStartDate": instructor_report_access_start_date,
+            "instructorReportAccessEndDate": instructor_report_access_end_date,
+            "taReportAccessStartDate": ta_report_access_start_date,
+            "taReportAccessEndDate": ta_report_access_end_date,
+            "customQuestionStartDate": custom_question_start_date,
+            "customQuestionEndDate": custom_question_end_date,
         }
-        return ProjectCourse(self._requester, "PUT", api_endpoint, data=data)
+        return ProjectCourse(self._requester, method, api_endpoint, data=data)
 
     def remove_project_course(self, course_id: int):
         """
@@ -250,7 +295,7 @@ class Project(CESObject):
         Returns:
             dict: The response from the API after removing the project course.
         """
-        api_endpoint = f"projects/{self.id}/courses/{course_id}"
+        api_endpoint = f"{self._endpoint}/courses/{course_id}"
         return self._requester.request("DELETE", api_endpoint)
 
     def list_respondents(self):
@@ -260,7 +305,7 @@ class Project(CESObject):
         Returns:
             Respondent: A Respondent object representing the retrieved respondents.
         """
-        api_endpoint = f"projects/{self.id}/respondents"
+        api_endpoint = f"{self._endpoint}/respondents"
         return Respondent(self._requester, "GET", api_endpoint)
 
     def list_non_respondents(self):
@@ -270,7 +315,7 @@ class Project(CESObject):
         Returns:
             NonRespondent: A NonRespondent object representing the retrieved non-respondents.
         """
-        api_endpoint = f"projects/{self.id}/nonRespondents"
+        api_endpoint = f"{self._endpoint}/nonRespondents"
         return NonRespondent(self._requester, "GET", api_endpoint)
 
     def get_response_rate(self):
@@ -280,7 +325,7 @@ class Project(CESObject):
         Returns:
             ResponseRate: A ResponseRate object representing the retrieved response rate.
         """
-        api_endpoint = f"projects/{self.id}/responseRate"
+        api_endpoint = f"{self._endpoint}/responseRate"
         return ResponseRate(self._requester, "GET", api_endpoint)
 
     def get_overall_response_rate(self):
@@ -290,7 +335,7 @@ class Project(CESObject):
         Returns:
             OverallResponseRate: An Overal ResponseRate object representing the overall project response rate.
         """
-        api_endpoint = f"projects/{self.id}/OverallResponseRate"
+        api_endpoint = f"{self._endpoint}/OverallResponseRate"
         return OverallResponseRate(self._requester, "GET", api_endpoint)
 
     def get_node_response(self):
@@ -300,7 +345,7 @@ class Project(CESObject):
         Returns:
             ResponseRate: A ResponseRate object representing the node response rate by project.
         """
-        api_endpoint = f"projects/{self.id}/NodeResponseRateByProject"
+        api_endpoint = f"{self._endpoint}/NodeResponseRateByProject"
         return NodeResponseRate(self._requester, "GET", api_endpoint)
 
     def get_raw_data(self):
@@ -310,5 +355,45 @@ class Project(CESObject):
         Returns:
             RawDataGeneral: A RawDataGeneral object representing the raw data by general project.
         """
-        api_endpoint = f"projects/{self.id}/general/rawData"
+        api_endpoint = f"{self._endpoint}/general/rawData"
         return RawDataGeneral(self._requester, "GET", api_endpoint)
+
+    def fetch_all(
+        self,
+        include: Iterable[str] = (
+            "surveys",
+            "courses",
+            "respondents",
+            "non_respondents",
+            "response_rate",
+        ),
+    ) -> Dict[str, CESObject]:
+        """
+        Fetches several related resources of the project concurrently.
+
+        The requests are independent, so they are sent in parallel and the total
+        wait is close to that of the slowest request rather than their sum.
+
+        Args:
+            include (Iterable[str], optional): The resources to fetch. Valid names are
+                "surveys", "courses", "respondents", "non_respondents", "response_rate",
+                "overall_response_rate", "node_response_rate" and "raw_data" (general
+                projects only). Defaults to surveys, courses, respondents,
+                non_respondents and response_rate.
+
+        Returns:
+            Dict[str, CESObject]: The fetched objects, keyed by the names in include.
+
+        Raises:
+            ValueError: If include contains an unknown name.
+        """
+        include = list(include)
+        unknown = [name for name in include if name not in self._RELATED_METHODS]
+        if unknown:
+            raise ValueError(f"Unknown project resources: {', '.join(unknown)}")
+
+        results = {
+            name: getattr(self, self._RELATED_METHODS[name])() for name in include
+        }
+        self._fetch_concurrently(list(results.values()))
+        return results
@@ -1,9 +1,8 @@
 from wcesapi.ces_object import CESObject
-from wcesapi.user import User
 
 
 class ProjectCourse(CESObject):
-    pass
+    __slots__ = ()
     # need to figure out relationship between projectCourse id, projectId, and courseId
     # def get_users(self, filters=None, **kwargs):
     #     """
@@ -2,4 +2,4 @@ from wcesapi.ces_object import CESObject
 
 
 class Question(CESObject):
-    pass
+    __slots__ = ()
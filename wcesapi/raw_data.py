@@ -2,8 +2,8 @@ from wcesapi.ces_object import CESObject
 
 
 class RawData(CESObject):
-    pass
+    __slots__ = ()
 
 
 class RawDataGeneral(CESObject):
-    pass
+    __slots__ = ()
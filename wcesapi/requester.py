@@ -1,16 +1,69 @@
 import logging
-from datetime import datetime
-from urllib.parse import urljoin
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import math
+import random
 import time
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, Optional, Literal, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover
+    requests_cache = None
 
 # HttpMethod type alias
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 
 logger = logging.getLogger(__name__)
 
+# Maximum random delay, in seconds, added to a server-requested Retry-After
+RETRY_AFTER_JITTER = 0.5
+
+# Default cap, in seconds, on the calculated backoff before jitter is applied
+MAX_RETRY_DELAY = 15
+
+# Cap, in seconds, on the delay honoured from a server's Retry-After header
+MAX_RETRY_AFTER = 120
+
+# Cached in place of response data for GETs that returned 404
+_NOT_FOUND = object()
+
+# Statuses that mean "try again later" rather than a failed request
+_RETRY_STATUSES = frozenset({429, 503})
+
+# Response cache entry: expiry time, JSON-decoded data and the ETag, if any
+CacheEntry = Tuple[float, Any, Optional[str]]
+
+# orjson parses response bodies several times faster than the standard library
+# when it is installed; both accept the raw bytes of the response.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_default(value: Any) -> str:
+    """Fallback encoder for datetimes, including subclasses such as pd.Timestamp."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value: Any) -> str:
+    """Serializes nested payload values compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            value, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), default=_json_default)
+
 
 class RequesterError(Exception):
     """Base class for Requester exceptions."""
@@ -36,6 +89,64 @@ class UnprocessableEntity(RequesterError):
     pass
 
 
+class CircuitOpen(RequesterError):
+    """Raised without a request while repeated server failures are cooling down."""
+
+    pass
+
+
+# Status codes with a dedicated exception; any other status >= 400 raises
+# RequesterError.
+_STATUS_ERRORS = {
+    401: (UnauthorizedAccess, "The access token is invalid."),
+    404: (ResourceDoesNotExist, "The requested resource was not found."),
+    422: (UnprocessableEntity, "The request parameters are invalid."),
+}
+
+
+class _TokenBucket:
+    """
+    Paces calls to a steady rate while allowing short bursts.
+
+    Tokens refill continuously at rate per second up to capacity, and each call
+    to acquire() takes one. When none are left the caller sleeps until its token
+    is due. Tokens are reserved under a lock and the sleep happens outside it, so
+    concurrent callers queue up in order rather than waking together.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Number of tokens added per second.
+            capacity (int): Maximum number of tokens held, i.e. the burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes one token, sleeping until it is available if necessary."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Empties the bucket after the server rate limited a request anyway."""
+        with self._lock:
+            self._tokens = min(self._tokens - 1, -1.0)
+
+
 class Requester:
     """
     Responsible for handling HTTP requests to the Course Evaluations & Surveys API.
@@ -46,6 +157,24 @@ class Requester:
         max_retries (Optional[int]): Maximum number of retry attempts for failed requests.
         retry_backoff (Optional[int]): Exponential backoff factor for retries (in seconds).
         rate_limit_delay (Optional[int]): Initial delay for rate limiting (in seconds).
+        max_retry_delay (float): Upper bound on the calculated backoff (in seconds).
+        cache_maxsize (int): Maximum number of GET responses kept in the response cache.
+        cache_ttl (float): Number of seconds a cached GET response stays valid.
+            Expired responses that carried an ETag are revalidated with
+            If-None-Match instead of being downloaded again.
+        negative_cache_ttl (float): Number of seconds a 404 for a GET is remembered
+            while the response cache is enabled.
+        pool_size (int): Maximum number of keep-alive connections to the API host.
+        cache_backend (Optional[str]): The requests-cache backend persisting GET
+            responses, or None when no persistent cache is used.
+        cache_name (Optional[str]): The name or path of the persistent cache, or
+            None when it is kept in the user cache directory.
+        circuit_breaker_threshold (int): Number of consecutive failed requests
+            after which requests fail fast; 0 disables the circuit breaker.
+        circuit_breaker_cooldown (float): Number of seconds requests fail fast
+            before a request is let through again.
+        requests_per_second (Optional[float]): The client-side pacing rate, or
+            None when requests are not paced.
     """
 
     def __init__(
@@ -55,6 +184,18 @@ class Requester:
         max_retries: Optional[int] = 3,
         retry_backoff: Optional[int] = 2,
         rate_limit_delay: Optional[int] = 1,
+        cache_maxsize: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        cache_backend: Optional[str] = None,
+        cache_expire_after: Optional[float] = None,
+        cache_name: Optional[str] = None,
+        eager_connect: bool = False,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_cooldown: Optional[float] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
     ):
         """
         Initializes the Requester with the given parameters.
@@ -65,6 +206,34 @@ class Requester:
             max_retries (Optional[int]): Maximum number of retry attempts for failed requests.
             retry_backoff (Optional[int]): Exponential backoff factor for retries (in seconds).
             rate_limit_delay (Optional[int]): Initial delay for rate limiting (in seconds).
+            cache_maxsize (Optional[int]): Maximum number of GET responses to cache.
+                The cache is disabled when this is None or 0.
+            cache_ttl (Optional[float]): Number of seconds a cached GET response stays valid.
+            negative_cache_ttl (Optional[float]): Number of seconds a 404 for a GET
+                is cached, so repeated lookups of a missing resource fail without a
+                request. Only used while the cache is enabled. Defaults to 5.
+            pool_size (Optional[int]): Maximum number of keep-alive connections kept
+                open to the API host. Defaults to 20.
+            cache_backend (Optional[str]): A requests-cache backend name, such as
+                "sqlite", used to persist GET responses across sessions. Requires
+                the optional requests-cache package.
+            cache_expire_after (Optional[float]): Number of seconds a persisted
+                GET response stays valid. Defaults to 3600.
+            cache_name (Optional[str]): The name or path of the persistent cache,
+                such as a SQLite file path. Defaults to "wcesapi_cache" in the user
+                cache directory.
+            eager_connect (bool): If True, open a pooled connection to the API host
+                in the background so the first request skips the TCP/TLS handshake.
+            circuit_breaker_threshold (Optional[int]): Number of consecutive failed
+                requests (server errors or exhausted retries) after which requests
+                raise CircuitOpen without being sent. Disabled when None or 0.
+            circuit_breaker_cooldown (Optional[float]): Number of seconds requests
+                fail fast once the circuit opens. Defaults to 30.
+            requests_per_second (Optional[float]): If set, outgoing requests are
+                paced to this rate so the server rarely has to answer 429.
+            burst (Optional[int]): Number of requests that may be sent at once
+                before pacing applies. Defaults to requests_per_second, rounded
+                down, and at least 1.
         """
         self.original_url: str = base_url
         self.base_url = base_url + "/api/"
@@ -74,8 +243,94 @@ class Requester:
         self.rate_limit_delay: int = (
             rate_limit_delay if rate_limit_delay is not None else 1
         )
-        self._session = requests.Session()
-        self._session.headers.update({"AuthToken": self.access_token})
+        self.max_retry_delay: float = MAX_RETRY_DELAY
+        self.cache_backend: Optional[str] = cache_backend
+        self.cache_name: Optional[str] = cache_name
+        self._session = self._create_session(
+            cache_backend, cache_expire_after, cache_name
+        )
+        self._session.headers.update(
+            {"AuthToken": self.access_token, "Accept": "application/json"}
+        )
+        # Keep enough pooled keep-alive connections for concurrent fetches so
+        # that parallel requests reuse connections instead of reconnecting.
+        self.pool_size: int = pool_size if pool_size is not None else 20
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self.cache_maxsize: int = cache_maxsize or 0
+        self.cache_ttl: float = cache_ttl if cache_ttl is not None else 60
+        # Kept short so that resources being created are picked up quickly
+        self.negative_cache_ttl: float = (
+            negative_cache_ttl if negative_cache_ttl is not None else 5
+        )
+        self._cache: "OrderedDict[Tuple[str, Tuple], CacheEntry]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self.circuit_breaker_threshold: int = circuit_breaker_threshold or 0
+        self.circuit_breaker_cooldown: float = (
+            circuit_breaker_cooldown if circuit_breaker_cooldown is not None else 30
+        )
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        self._circuit_lock = threading.Lock()
+
+        # Monotonic time until which requests hold back after a 429 or 503
+        self._rate_limited_until = 0.0
+        self._rate_limit_lock = threading.Lock()
+        self.requests_per_second: Optional[float] = requests_per_second
+        self._rate_limiter: Optional[_TokenBucket] = None
+        if requests_per_second:
+            self._rate_limiter = _TokenBucket(
+                requests_per_second, burst or max(1, int(requests_per_second))
+            )
+
+        if eager_connect:
+            threading.Thread(target=self._warm_up, daemon=True).start()
+
+    @staticmethod
+    def _create_session(
+        cache_backend: Optional[str],
+        cache_expire_after: Optional[float],
+        cache_name: Optional[str] = None,
+    ) -> requests.Session:
+        """
+        Creates the HTTP session, backed by a persistent cache if one is requested.
+
+        Cached responses are keyed on the AuthToken header, so clients using
+        different tokens never read each other's responses.
+
+        Args:
+            cache_backend (Optional[str]): The requests-cache backend name, or None.
+            cache_expire_after (Optional[float]): Number of seconds a persisted GET
+                response stays valid.
+            cache_name (Optional[str]): The name or path of the cache, or None for
+                "wcesapi_cache" in the user cache directory.
+
+        Returns:
+            requests.Session: The session used for all requests.
+
+        Raises:
+            ImportError: If a cache backend is requested but requests-cache is not
+                installed.
+        """
+        if cache_backend is None:
+            return requests.Session()
+        if requests_cache is None:
+            raise ImportError(
+                "cache_backend requires requests-cache; "
+                'install it with pip install "wcesapi[cache]"'
+            )
+        return requests_cache.CachedSession(
+            cache_name or "wcesapi_cache",
+            backend=cache_backend,
+            expire_after=cache_expire_after if cache_expire_after is not None else 3600,
+            allowable_methods=("GET",),
+            cache_control=True,
+            match_headers=["AuthToken"],
+            use_cache_dir=cache_name is None,
+        )
 
     def set_retry_options(
         self, max_retries: Optional[int], retry_backoff: Optional[int]
@@ -99,6 +354,45 @@ class Requester:
         """
         self.rate_limit_delay = rate_limit_delay if rate_limit_delay is not None else 1
 
+    def set_cache_options(
+        self, cache_maxsize: Optional[int], cache_ttl: Optional[float]
+    ) -> None:
+        """
+        Sets the response cache options for the requester and clears the cache.
+
+        Args:
+            cache_maxsize (Optional[int]): Maximum number of GET responses to cache.
+                The cache is disabled when this is None or 0.
+            cache_ttl (Optional[float]): Number of seconds a cached GET response stays valid.
+        """
+        self.cache_maxsize = cache_maxsize or 0
+        self.cache_ttl = cache_ttl if cache_ttl is not None else 60
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Removes all responses from the response cache and the persistent cache."""
+        with self._cache_lock:
+            self._cache.clear()
+        if self.cache_backend is not None:
+            self._session.cache.clear()
+
+    def _warm_up(self) -> None:
+        """Opens a keep-alive connection to the API host with a lightweight request."""
+        try:
+            self._session.head(self.base_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
+    def close(self) -> None:
+        """Closes the HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "Requester":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def request(
         self,
         method: HttpMethod,
@@ -126,29 +420,179 @@ class Requester:
             UnprocessableEntity: If the request parameters are invalid.
             RequesterError: For other HTTP errors or if all retries fail.
         """
-        url = urljoin(self.base_url, endpoint)
+        # base_url always ends in "/api/", so plain concatenation is enough and
+        # avoids parsing both URLs on every request.
+        url = self.base_url + endpoint.lstrip("/")
         request_kwargs = self._prepare_request_kwargs(params, data)
 
-        logger.info(f"Request: {method} {url}")
-        logger.debug(f"Request data: {request_kwargs}")
+        cache_key = None
+        stale_entry = None
+        if method == "GET" and self.cache_maxsize:
+            cache_key = (url, tuple(sorted(request_kwargs.get("params", {}).items())))
+            entry = self._get_cached(cache_key)
+            if entry is not None:
+                expires_at, cached, etag = entry
+                if time.monotonic() < expires_at:
+                    logger.info("Cached response: %s %s", method, url)
+                    if cached is _NOT_FOUND:
+                        self._raise_not_found()
+                    return cached
+                # Expired but revalidatable: a 304 reply reuses the cached data
+                stale_entry = entry
+                request_kwargs["headers"] = {"If-None-Match": etag}
+
+        self._check_circuit()
+        logger.info("Request: %s %s", method, url)
+        logger.debug("Request data: %s", request_kwargs)
 
         for attempt in range(self.max_retries):
             try:
+                self._wait_for_rate_limit()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
                 response = self._session.request(method, url, **request_kwargs)
-                self._log_response(response)
 
-                if response.status_code != 429:  # Not rate limited
+                if response.status_code == 304 and stale_entry is not None:
+                    self._record_outcome(failed=False)
+                    self._log_response(response)
+                    _, result, etag = stale_entry
+                    self._store_cached(cache_key, result, etag)
+                    return result
+
+                if response.status_code not in _RETRY_STATUSES:
+                    # Successful bodies are parsed once and logged from the result
+                    result = self._parse_response(response) if response.ok else None
+                    self._log_response(response, result)
+                    self._record_outcome(failed=response.status_code >= 500)
+                    if response.status_code == 404 and cache_key is not None:
+                        self._store_cached(
+                            cache_key, _NOT_FOUND, ttl=self.negative_cache_ttl
+                        )
                     self._handle_errors(response)
-                    return self._parse_response(response)
+                    if cache_key is not None:
+                        self._store_cached(
+                            cache_key, result, response.headers.get("ETag")
+                        )
+                    elif method != "GET":
+                        # A write may change any cached resource
+                        self.clear_cache()
+                    return result
 
-                self._handle_rate_limit(attempt)
+                self._log_response(response)
+                if response.status_code == 429 and self._rate_limiter is not None:
+                    # The pacing rate was too high; hold back the next requests
+                    self._rate_limiter.penalize()
+                if attempt < self.max_retries - 1:
+                    # No point waiting after the final attempt
+                    self._handle_rate_limit(attempt, response)
             except requests.RequestException as e:
-                logger.error(f"Request failed on attempt {attempt + 1}: {str(e)}")
+                logger.error("Request failed on attempt %d: %s", attempt + 1, e)
                 if attempt == self.max_retries - 1:
+                    self._record_outcome(failed=True)
                     raise RequesterError(f"Request failed after all retries: {str(e)}")
 
+        self._record_outcome(failed=True)
         raise RequesterError("Request failed after all retries")
 
+    def _check_circuit(self) -> None:
+        """
+        Fails fast while the circuit breaker is open.
+
+        Once the cooldown has passed, a single request is let through as a probe.
+        The circuit stays open for other requests until the probe's outcome is
+        recorded, or until another cooldown passes if it never is.
+
+        Raises:
+            CircuitOpen: If the failure threshold was reached and either the
+                cooldown has not yet passed or a probe is already in flight.
+        """
+        if not self.circuit_breaker_threshold:
+            return
+        with self._circuit_lock:
+            if self._consecutive_failures < self.circuit_breaker_threshold:
+                return
+            now = time.monotonic()
+            if now < self._circuit_open_until:
+                raise CircuitOpen(
+                    "Too many consecutive failed requests; not sending requests "
+                    f"for up to {self.circuit_breaker_cooldown} seconds."
+                )
+            # This request is the probe; hold the others back meanwhile
+            self._circuit_open_until = now + self.circuit_breaker_cooldown
+
+    def _record_outcome(self, failed: bool) -> None:
+        """
+        Updates the circuit breaker with the outcome of a request.
+
+        A success closes the circuit. A failure that reaches the threshold opens
+        it for the cooldown period; once that passes, a single probe request is
+        let through, and its failure opens the circuit again.
+
+        Args:
+            failed (bool): Whether the request failed.
+        """
+        if not self.circuit_breaker_threshold:
+            return
+        with self._circuit_lock:
+            if not failed:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.circuit_breaker_threshold:
+                self._circuit_open_until = (
+                    time.monotonic() + self.circuit_breaker_cooldown
+                )
+
+    def _get_cached(self, cache_key: Tuple[str, Tuple]) -> Optional[CacheEntry]:
+        """
+        Looks up a response in the cache.
+
+        Expired entries are dropped unless they carry an ETag, in which case they
+        are returned so the caller can revalidate them.
+
+        Args:
+            cache_key (Tuple[str, Tuple]): The URL and sorted query parameters.
+
+        Returns:
+            Optional[CacheEntry]: The expiry time, response data and ETag, or None
+                if the response is missing or expired without an ETag.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, _, etag = entry
+            if time.monotonic() >= expires_at and etag is None:
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+            return entry
+
+    def _store_cached(
+        self,
+        cache_key: Tuple[str, Tuple],
+        result: Any,
+        etag: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Stores a response in the cache, evicting the least recently used entry if full.
+
+        Args:
+            cache_key (Tuple[str, Tuple]): The URL and sorted query parameters.
+            result (Any): The JSON-decoded response data.
+            etag (Optional[str]): The response's ETag, if the server sent one.
+            ttl (Optional[float]): Number of seconds the entry stays valid.
+                Defaults to cache_ttl.
+        """
+        if ttl is None:
+            ttl = self.cache_ttl
+        with self._cache_lock:
+            self._cache[cache_key] = (time.monotonic() + ttl, result, etag)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_maxsize:
+                self._cache.popitem(last=False)
+
     def _prepare_request_kwargs(
         self,
         params: Optional[Dict[str, Any]],
@@ -167,30 +611,26 @@ class Requester:
         request_kwargs = {}
 
         if params:
-            request_kwargs["params"] = {
-                k: self._format_value(v) for k, v in params.items()
-            }
+            request_kwargs["params"] = self._format_values(params)
 
         if data:
-            data = self._filter_none_values(data)
-            request_kwargs["data"] = {k: self._format_value(v) for k, v in data.items()}
-            self._session.headers.update(
-                {"Content-Type": "application/x-www-form-urlencoded"}
-            )
+            # requests form-encodes dict data and sets the Content-Type itself
+            request_kwargs["data"] = self._format_values(data)
         return request_kwargs
 
-    @staticmethod
-    def _filter_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def _format_values(cls, data: Dict[str, Any]) -> Dict[str, str]:
         """
-        Filters out None values from the data dictionary.
+        Formats the values of a dictionary for the API request, dropping None values.
 
         Args:
-            data (Dict[str, Any]): The data dictionary to filter.
+            data (Dict[str, Any]): The data dictionary to format.
 
         Returns:
-            Dict[str, Any]: The filtered data dictionary without None values.
+            Dict[str, str]: The formatted data dictionary without None values.
         """
-        return {k: v for k, v in data.items() if v is not None}
+        format_value = cls._format_value
+        return {k: format_value(v) for k, v in data.items() if v is not None}
 
     @staticmethod
     def _format_value(value: Any) -> str:
@@ -203,10 +643,15 @@ class Requester:
         Returns:
             str: The formatted value.
         """
+        if type(value) is str:  # The common case needs no conversion
+            return value
         if isinstance(value, bool):
             return str(value).lower()
         elif isinstance(value, datetime):
             return value.isoformat()  # Ensure UTC format
+        elif isinstance(value, (dict, list, tuple)):
+            # Nested structures go out as JSON rather than their Python repr.
+            return _json_dumps(value)
         return str(value)
 
     def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
@@ -220,8 +665,8 @@ class Requester:
             Dict[str, Any]: The JSON-decoded response data.
         """
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return _json_loads(response.content)
+        except ValueError:
             logger.warning("Failed to parse JSON, returning raw text")
             return {"raw_text": response.text}
 
@@ -229,8 +674,11 @@ class Requester:
         """
         Calculate the delay for rate limiting based on the attempt number.
 
-        This method uses an exponential backoff strategy to determine
-        the delay time for rate-limited requests.
+        This method uses exponential backoff with full jitter: the delay is drawn
+        uniformly between zero and twice rate_limit_delay * retry_backoff**attempt,
+        capped at max_retry_delay. Clients rate limited together therefore spread
+        out their retries, while, below the cap, the average delay matches the
+        unjittered rate_limit_delay * retry_backoff**attempt schedule.
 
         Args:
             attempt (int): The current attempt number (0-indexed).
@@ -238,40 +686,120 @@ class Requester:
         Returns:
             float: The calculated delay in seconds.
         """
-        return self.rate_limit_delay * (self.retry_backoff**attempt)
+        bound = 2 * self.rate_limit_delay * (self.retry_backoff**attempt)
+        return random.random() * min(bound, self.max_retry_delay)
 
-    def _handle_rate_limit(self, attempt: int) -> None:
+    @staticmethod
+    def _parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """
+        Reads the delay requested by the server's Retry-After header.
+
+        Args:
+            response (Optional[requests.Response]): The rate-limited response.
+
+        Returns:
+            Optional[float]: The delay in seconds, capped at MAX_RETRY_AFTER, or
+                None if the header is missing, is not finite, or is neither a
+                number of seconds nor an HTTP date.
+        """
+        if response is None or "Retry-After" not in response.headers:
+            return None
+        retry_after = response.headers["Retry-After"]
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        if not math.isfinite(delay):
+            return None
+        return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+    def _handle_rate_limit(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> None:
         """
         Handle rate limiting by implementing exponential backoff.
 
-        This method calculates the appropriate delay using _calculate_rate_limit_delay,
-        logs a warning message, and then waits for the calculated delay.
+        The delay requested by the server's Retry-After header, plus a small
+        random jitter, is used when present; otherwise it is calculated using
+        _calculate_rate_limit_delay. This method logs a warning message, records
+        the end of the delay so concurrent requests wait for it too, and then
+        waits for the delay.
 
         Args:
             attempt (int): The current attempt number (0-indexed).
+            response (Optional[requests.Response]): The rate-limited response.
 
         Returns:
             None
         """
-        retry_after = self._calculate_rate_limit_delay(attempt)
-        logger.warning(f"Rate limited. Retrying after {retry_after} seconds.")
+        retry_after = self._parse_retry_after(response)
+        if retry_after is None:
+            retry_after = self._calculate_rate_limit_delay(attempt)
+        else:
+            # Concurrent fetches told to wait the same time should not all
+            # retry at the same instant.
+            retry_after += random.uniform(0, RETRY_AFTER_JITTER)
+        logger.warning("Rate limited. Retrying after %s seconds.", retry_after)
+        # Other threads sharing this Requester hold back until the same deadline
+        with self._rate_limit_lock:
+            self._rate_limited_until = max(
+                self._rate_limited_until, time.monotonic() + retry_after
+            )
         time.sleep(retry_after)
 
-    def _log_response(self, response: requests.Response) -> None:
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Sleeps until a rate-limit backoff started by another request has passed.
+
+        Each waiter adds its own random jitter so that the threads held back by
+        one backoff do not all send their requests at the same instant.
+        """
+        with self._rate_limit_lock:
+            wait = self._rate_limited_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait + random.uniform(0, RETRY_AFTER_JITTER))
+
+    def _log_response(
+        self, response: requests.Response, data: Optional[Any] = None
+    ) -> None:
         """
         Logs the response details.
 
         Args:
             response (requests.Response): The HTTP response to log.
+            data (Optional[Any]): The already parsed response data, if any. When
+                omitted, the body is decoded for the debug log.
         """
         logger.info(
-            f"Response: {response.request.method} {response.url} {response.status_code}"
+            "Response: %s %s %s",
+            response.request.method,
+            response.url,
+            response.status_code,
         )
-        logger.debug(f"Response headers: {response.headers}")
+        # Decoding the body for the debug log is expensive on large responses,
+        # so only do it when debug output will actually be emitted.
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Response headers: %s", response.headers)
+        if data is not None:
+            logger.debug("Response data: %s", data)
+            return
         try:
-            logger.debug(f"Response data: {response.json()}")
+            logger.debug("Response data: %s", response.json())
         except json.JSONDecodeError:
-            logger.debug(f"Response data: {response.text}")
+            logger.debug("Response data: %s", response.text)
+
+    @staticmethod
+    def _raise_not_found() -> None:
+        """Raises ResourceDoesNotExist with its standard message."""
+        exception_class, message = _STATUS_ERRORS[404]
+        raise exception_class(message)
 
     def _handle_errors(self, response: requests.Response) -> None:
         """
@@ -286,11 +814,11 @@ class Requester:
             UnprocessableEntity: If the request parameters are invalid.
             RequesterError: For other HTTP errors.
         """
-        if response.status_code == 401:
-            raise UnauthorizedAccess("The access token is invalid.")
-        elif response.status_code == 404:
-            raise ResourceDoesNotExist("The requested resource was not found.")
-        elif response.status_code == 422:
-            raise UnprocessableEntity("The request parameters are invalid.")
-        elif response.status_code >= 400:
-            raise RequesterError(f"HTTP error {response.status_code}: {response.text}")
+        status_code = response.status_code
+        if status_code < 400:
+            return
+        error = _STATUS_ERRORS.get(status_code)
+        if error is not None:
+            exception_class, message = error
+            raise exception_class(message)
+        raise RequesterError(f"HTTP error {status_code}: {response.text}")
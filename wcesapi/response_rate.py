@@ -2,12 +2,12 @@ from wcesapi.ces_object import CESObject
 
 
 class ResponseRate(CESObject):
-    pass
+    __slots__ = ()
 
 
 class OverallResponseRate(CESObject):
-    pass
+    __slots__ = ()
 
 
 class NodeResponseRate(CESObject):
-    pass
+    __slots__ = ()
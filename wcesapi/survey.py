@@ -4,6 +4,7 @@ from wcesapi.response_rate import ResponseRate
 
 
 class Survey(CESObject):
+    __slots__ = ()
 
     def get_questions(self):
         """